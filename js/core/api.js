@@ -31,6 +31,21 @@ export async function status(jobId) {
   return jfetch(`/api/status?jobId=${encodeURIComponent(jobId)}`);
 }
 
+// Follow a job over /api/status/stream (SSE). onUpdate gets { state, progress, delta }
+// per event; resolves with the final event, rejects if the stream can't be used.
+export function watchStatus(jobId, onUpdate) {
+  return new Promise((resolve, reject) => {
+    if (typeof EventSource === 'undefined') { reject(new Error('EventSource unavailable')); return; }
+    const es = new EventSource(`/api/status/stream?jobId=${encodeURIComponent(jobId)}`);
+    es.onmessage = (ev) => {
+      const st = JSON.parse(ev.data);
+      onUpdate(st);
+      if (st.state === 'done' || st.state === 'error' || st.state === 'idle') { es.close(); resolve(st); }
+    };
+    es.onerror = () => { es.close(); reject(new Error('status stream closed')); };
+  });
+}
+
 export async function manifest() {
   return jfetch('/api/data/manifest');
 }
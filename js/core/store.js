@@ -29,9 +29,10 @@ function writePrefs(p) {
 
 // --- safe fetch that never throws and never returns non-JSON ---
 // (Handles cases where server returns HTML like "<!doctype ...>" by falling back to [])
+// 'no-cache' revalidates via ETag, so unchanged artifacts come back as a 304.
 async function safeJson(url) {
   try {
-    const res = await fetch(url, { cache: 'no-store' });
+    const res = await fetch(url, { cache: 'no-cache' });
     if (!res.ok) return [];
     const ct = (res.headers.get('content-type') || '').toLowerCase();
     const text = await res.text();
@@ -145,13 +145,50 @@ export async function openDataPanel(store) {
 
     try {
       const { jobId } = await api.rebuild({ layers });
-      await poll(jobId);
+      await watch(jobId);
     } catch (e) {
       logBox.textContent = `Error: ${e.message || e}`;
       [ckOfficial, ckWorkshop, ckDev, startBtn].forEach(el => el.disabled = false);
     }
   });
 
+  function showStatus(st, logText) {
+    const p = Math.max(0, Math.min(1, Number(st.progress || 0)));
+    progBar.firstChild.style.width = `${Math.round(p*100)}%`;
+    logBox.textContent = logText.slice(-4000);
+  }
+
+  // Returns true once the job has finished (either way).
+  function finish(st) {
+    if (st.state === 'done') {
+      logBox.textContent += '\n✓ Done. Reloading…';
+      // Unconditional page reload – simplest and always correct
+      setTimeout(() => window.location.reload(), 150);
+      return true;
+    }
+    if (st.state === 'error') {
+      logBox.textContent += '\n✗ Build failed.';
+      [ckOfficial, ckWorkshop, ckDev, startBtn].forEach(el => el.disabled = false);
+      return true;
+    }
+    return false;
+  }
+
+  // Prefer the SSE stream (pushes only log deltas); fall back to polling if it breaks.
+  async function watch(jobId) {
+    let logText = '';
+    let last = null;
+    try {
+      last = await api.watchStatus(jobId, (st) => {
+        logText = (logText + (st.delta || '')).slice(-4000);
+        showStatus(st, logText);
+      });
+    } catch {}
+    if (!last || !finish(last)) { await poll(jobId); return; }
+    // Refresh manifest list after completion (best-effort)
+    try { man = await api.manifest(); renderFiles(); } catch {}
+  }
+
   async function poll(jobId) {
     let done = false;
     while (!done) {
@@ -159,19 +196,8 @@ export async function openDataPanel(store) {
       let st;
       try { st = await api.status(jobId); }
       catch (e) { logBox.textContent = `Status error: ${e.message || e}`; break; }
-      const p = Math.max(0, Math.min(1, Number(st.progress || 0)));
-      progBar.firstChild.style.width = `${Math.round(p*100)}%`;
-      logBox.textContent = (st.logTail || '').slice(-4000);
-      if (st.state === 'done') {
-        done = true;
-        logBox.textContent += '\n✓ Done. Reloading…';
-        // Unconditional page reload – simplest and always correct
-        setTimeout(() => window.location.reload(), 150);
-      } else if (st.state === 'error') {
-        done = true;
-        logBox.textContent += '\n✗ Build failed.';
-        [ckOfficial, ckWorkshop, ckDev, startBtn].forEach(el => el.disabled = false);
-      }
+      showStatus(st, st.logTail || '');
+      done = finish(st);
     }
     // Refresh manifest list after completion (best-effort)
     try { man = await api.manifest(); renderFiles(); } catch {}
@@ -0,0 +1,40 @@
+"""
+Small, fully annotated helpers that helper.py calls on every request.
+
+Plain Python on purpose so the module can be compiled with mypyc:
+    pip install "mypy[mypyc]"
+    cd tools && mypyc _helper_hot.py
+The resulting _helper_hot.*.so is picked up ahead of this file on import; without it the
+pure-Python version runs unchanged.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+
+def as_list(v: object) -> List[str]:
+    """Normalize a possibly-empty string/array into a clean list[str]."""
+    if v is None:
+        return []
+    if isinstance(v, str):
+        s = v.strip()
+        return [s] if s else []
+    if isinstance(v, (list, tuple)):
+        out: List[str] = []
+        for x in v:
+            # Straight from JSON this is almost always a str: skip the str() cast then.
+            xs = x if isinstance(x, str) else str(x)
+            if xs.strip():
+                out.append(xs)
+        return out
+    s = str(v).strip()
+    return [s] if s else []
+
+
+def resolve_out(out_value: str, base: Path) -> Path:
+    """config["out"] as an absolute path, relative values taken from base."""
+    out = Path(out_value)
+    if not out.is_absolute():
+        out = (base / out).resolve()
+    return out
@@ -13,6 +13,7 @@ API:
   PUT  /api/config                -> write config (accepts arrays or single strings)
   POST /api/rebuild               -> { jobId } body: { layers:["official","workshop","dev"], includeLanguages?, extraExcludes? }
   GET  /api/status?jobId=...      -> { state, progress, logTail }
+  GET  /api/status/stream?jobId=  -> text/event-stream of { state, progress, delta }
   GET  /api/data/manifest         -> { files:[{name,size,mtime}], version }
   GET  /data/<filename>           -> serve generated artifacts
   GET  /                          -> serves index.html from the repo root
@@ -26,21 +27,52 @@ This file wraps the functions in rimdefs_build.py, which already handles:
 """
 from __future__ import annotations
 
-import io
+import collections
+import copy
+import gzip
+import hashlib
 import json
+import mimetypes
+import multiprocessing
 import os
+import re
+import secrets
+import shutil
+import stat
+import struct
 import sys
 import threading
-import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from flask import Flask, jsonify, request, send_from_directory, Response
+from flask import Flask, abort, jsonify, request, send_from_directory, Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import safe_join
+from werkzeug.wsgi import wrap_file
+
+try:  # optional: faster JSON encode/decode (pip install orjson); stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: .zst precompressed artifacts next to the .gz ones (pip install zstandard)
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:  # optional: multi-threaded production WSGI server (pip install waitress); Werkzeug dev server otherwise
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
 
 # --- Import builder module (lives next to this helper in tools/) ---
 # Provides DEFAULT_OUT, DEFAULT_CONFIG_PATH, DEFAULT_PRUNE_DIRS,
 # detect_rimworld_version(), build_layer(), ensure_default_config(), etc.  # filecite: turn0file0 
 import rimdefs_build as rb
+# Per-request hot paths; compiled with mypyc when a _helper_hot.*.so sits next to this file.
+import _helper_hot
 
 
 # ---------- Paths & roots ----------
@@ -51,6 +83,11 @@ UI_ROOT = TOOLS_DIR.parent
 # Config (kept next to the builder under tools/)
 CONFIG_PATH = rb.DEFAULT_CONFIG_PATH  # tools/rimdefs.config.json  # filecite: turn0file0 
 
+# Default prune sets, computed once: _BASE_PRUNE skips Languages/, _BASE_PRUNE_NO_LANG
+# doesn't (for include_languages).
+_BASE_PRUNE = frozenset(s.lower() for s in rb.DEFAULT_PRUNE_DIRS)
+_BASE_PRUNE_NO_LANG = _BASE_PRUNE - {"languages"}
+
 
 def resolve_out_dir(cfg: Dict) -> Path:
     """
@@ -59,35 +96,161 @@ def resolve_out_dir(cfg: Dict) -> Path:
     Otherwise fall back to the builder's DEFAULT_OUT (which is ../data for this layout).
     """
     if "out" in cfg and str(cfg["out"]).strip():
-        out = Path(cfg["out"])
-        if not out.is_absolute():
-            out = (CONFIG_PATH.parent / out).resolve()
-        return out
+        return _resolve_out(str(cfg["out"]), CONFIG_PATH.parent)
     return rb.DEFAULT_OUT  # in this layout it's <repo>/data  # filecite: turn0file0 
 
 
+_resolve_out = lru_cache(maxsize=32)(_helper_hot.resolve_out)
+
+
+def norm_roots(values: List[str]) -> List[Path]:
+    """rb._norm_path_list() relative to the config folder, memoized on the raw strings."""
+    return list(_norm_roots(tuple(str(v) for v in (values or [])), CONFIG_PATH.parent))
+
+
+@lru_cache(maxsize=64)
+def _norm_roots(values: Tuple[str, ...], base: Path) -> Tuple[Path, ...]:
+    return tuple(rb._norm_path_list(list(values), base))
+
+
+# Official root → the Version.txt that rb.detect_rimworld_version() reads for it.
+# Misses aren't remembered, so a game installed later is still picked up.
+_VERSION_TXT: Dict[Path, Path] = {}
+
+
+def detect_version(official: List[Path]) -> str:
+    """rb.detect_rimworld_version(), memoized on the (mtime, size) of the Version.txt files involved."""
+    key = []
+    for root in official:
+        vt = _VERSION_TXT.get(root)
+        if vt is None:
+            base = rb._ancestor_with_version_txt(root)
+            if base is not None:
+                vt = _VERSION_TXT[root] = base / "Version.txt"
+        try:
+            st = os.stat(vt) if vt is not None else None
+        except OSError:
+            _VERSION_TXT.pop(root, None)
+            st = None
+        key.append((st.st_mtime_ns, st.st_size) if st else None)
+    return _detect_cached(tuple(official), tuple(key))
+
+
+@lru_cache(maxsize=32)
+def _detect_cached(official: Tuple[Path, ...], vtxt_key: Tuple) -> str:
+    return rb.detect_rimworld_version(list(official)) or ""
+
+
+def _json_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON for files written to disk."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 # ---------- Config IO ----------
 
+# Last parsed config, keyed on (path, st_mtime_ns, st_size) of the file.
+# Callers always get a deep copy, so the cached dict can't be mutated.
+# "out" memoizes resolve_out_dir() for that same config.
+_CFG_CACHE: Dict = {"key": None, "val": None, "out": None}
+_cfg_lock = threading.Lock()
+
+
+def _config_key() -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (str(CONFIG_PATH), st.st_mtime_ns, st.st_size)
+
+
 def load_config() -> Dict:
-    if CONFIG_PATH.exists():
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-    rb.ensure_default_config(CONFIG_PATH)  # writes built-in defaults if missing  # filecite: turn0file0 
-    return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    key = _config_key()
+    if key is None:
+        rb.ensure_default_config(CONFIG_PATH)  # writes built-in defaults if missing  # filecite: turn0file0 
+        key = _config_key()
+    with _cfg_lock:
+        if key is None or _CFG_CACHE["key"] != key:
+            _CFG_CACHE["val"] = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            _CFG_CACHE["out"] = None
+            _CFG_CACHE["key"] = key
+        return copy.deepcopy(_CFG_CACHE["val"])
+
+
+def current_out_dir() -> Path:
+    """
+    resolve_out_dir(load_config()) without the config copy or Path.resolve(), as long as the
+    config file is unchanged; write_config() (PUT /api/config) invalidates it.
+    """
+    key = _config_key()
+    with _cfg_lock:
+        out = _CFG_CACHE["out"]
+        if out is not None and key is not None and _CFG_CACHE["key"] == key:
+            return out
+    out = resolve_out_dir(load_config())
+    with _cfg_lock:
+        if _CFG_CACHE["key"] == key:
+            _CFG_CACHE["out"] = out
+    return out
 
 
 def write_config(cfg: Dict) -> None:
+    data = _json_bytes(cfg)
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
+    with _cfg_lock:
+        try:
+            if CONFIG_PATH.read_bytes() == data:
+                return  # UI re-saved an unchanged form: keep the file, its mtime and the caches
+        except OSError:
+            pass
+        # Write-then-rename so readers never see a truncated or half-written config.
+        tmp = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CONFIG_PATH)
+        # A same-size rewrite within one mtime tick would look unchanged; drop the caches
+        # keyed on it (including the GET /api/config body and ETag).
+        _CFG_CACHE["key"] = None
+        _API_CONFIG_CACHE["entry"] = None
+
+
+_as_list = _helper_hot.as_list
+
 
+# ---------- Precompressed artifacts ----------
 
-def _as_list(v) -> List[str]:
-    """Normalize a possibly-empty string/array into a clean list[str]."""
-    if v is None:
-        return []
-    if isinstance(v, (list, tuple)):
-        return [str(x) for x in v if str(x).strip()]
-    s = str(v).strip()
-    return [s] if s else []
+# (Content-Encoding, file suffix), best first. /data serves a sibling only if it's at least
+# as new as the artifact itself, so stale or missing ones fall back to the plain file.
+_PRECOMPRESSED = (("zstd", ".zst"), ("gzip", ".gz"))
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def precompress(path: Path) -> None:
+    """
+    Write path.gz (and path.zst when zstandard is installed) for a freshly written artifact.
+    Streamed file to file, so a large items.<L>.json is never held in memory.
+    """
+    gz = path.with_name(path.name + ".gz")
+    tmp = gz.with_name(gz.name + ".tmp")
+    # filename="" keeps the .tmp name out of the gzip header.
+    with open(path, "rb") as src, open(tmp, "wb") as f, \
+            gzip.GzipFile(filename="", mode="wb", compresslevel=6, fileobj=f, mtime=0) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, gz)
+    if zstandard is not None:
+        zst = path.with_name(path.name + ".zst")
+        tmp = zst.with_name(zst.name + ".tmp")
+        with open(path, "rb") as src, open(tmp, "wb") as dst:
+            zstandard.ZstdCompressor(level=9).copy_stream(src, dst)
+        os.replace(tmp, zst)
 
 
 # ---------- Build job handling ----------
@@ -99,71 +262,105 @@ class _Job:
         include_languages: Optional[bool] = None,
         extra_excludes: Optional[List[str]] = None,
     ):
-        self.id = uuid.uuid4().hex
+        self.id = secrets.token_hex(8)  # 64 random bits; plenty for a single-user tool
         self.layers = layers
         self.include_languages = include_languages
         self.extra_excludes = extra_excludes or []
         self.state = "queued"  # queued | running | done | error
         self.progress = 0.0
-        self._log = ""
+        # Bounded ring of raw write() chunks; appends are O(len(s)) and old output falls off.
+        self._log_chunks: collections.deque = collections.deque(maxlen=512)
+        self._log_bytes = 0  # total characters ever written
         self._err: Optional[str] = None
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        # Bumped on every log write / state change; status streams wait on it.
+        self._changes = 0
+        self._changed = threading.Condition(self._lock)
 
     def log_write(self, s: str) -> None:
         with self._lock:
-            self._log += s
-            if len(self._log) > 100_000:
-                self._log = self._log[-80_000:]
+            self._log_chunks.append(s)
+            self._log_bytes += len(s)
+            self._changes += 1
+            self._changed.notify_all()
 
     def log_tail(self) -> str:
         with self._lock:
-            return self._log[-5000:]
+            chunks = list(self._log_chunks)
+        return "".join(chunks)[-5000:]
+
+    def log_since(self, cursor: int) -> Tuple[str, int]:
+        """Log text written after position `cursor`, and the new cursor (as far back as the ring reaches)."""
+        with self._lock:
+            total = self._log_bytes
+            want = total - cursor
+            picked: List[str] = []
+            got = 0
+            for chunk in reversed(self._log_chunks):
+                if got >= want:
+                    break
+                picked.append(chunk)
+                got += len(chunk)
+        text = "".join(reversed(picked))
+        if got > want:
+            text = text[got - want:]
+        return text, total
+
+    def wait_change(self, seen: int, timeout: float) -> int:
+        """Block until something changed since `seen` (or timeout); returns the current change count."""
+        with self._lock:
+            self._changed.wait_for(lambda: self._changes != seen, timeout)
+            return self._changes
+
+    def _touch(self) -> None:
+        with self._lock:
+            self._changes += 1
+            self._changed.notify_all()
 
     def start(self) -> None:
         t = threading.Thread(target=self._run, name=f"rebuild-{self.id}", daemon=True)
         self._thread = t
         t.start()
 
+    def _drain(self, rf) -> None:
+        """Reader side of the builder's stdout pipe: one log_write per line."""
+        with rf:
+            for line in rf:
+                self.log_write(line)
+
     def _run(self) -> None:
         self.state = "running"
 
-        class _Writer(io.TextIOBase):
-            def write(_self, s):
-                self.log_write(s)
-                return len(s)
-
-        w = _Writer()
-
         try:
+            # Paths are resolved afresh per rebuild: folders may have moved since the last one.
+            _resolve_out.cache_clear()
+            _norm_roots.cache_clear()
             cfg = load_config()
-            base_for_rel = CONFIG_PATH.parent
 
             # Normalize roots for each layer  # filecite: turn0file0 
-            official = rb._norm_path_list(cfg.get("official", []), base_for_rel)
-            workshop = rb._norm_path_list(cfg.get("workshop", []), base_for_rel)
-            dev      = rb._norm_path_list(cfg.get("dev", []), base_for_rel)
+            official = norm_roots(cfg.get("official", []))
+            workshop = norm_roots(cfg.get("workshop", []))
+            dev      = norm_roots(cfg.get("dev", []))
 
             out_dir = resolve_out_dir(cfg)
             out_dir.mkdir(parents=True, exist_ok=True)
 
             # Version precedence: config.version or autodetected Version.txt  # filecite: turn0file0 
-            detected_version = rb.detect_rimworld_version(official) or None
+            detected_version = detect_version(official) or None
             version = cfg.get("version") or detected_version or "unknown"
 
             # Build prune set  # filecite: turn0file0 
-            prune = set(rb.DEFAULT_PRUNE_DIRS)
             include_lang = self.include_languages
             if include_lang is None:
                 include_lang = bool(cfg.get("include_languages", False))
-            if include_lang and "languages" in prune:
-                prune.remove("languages")
-            for nm in (cfg.get("exclude") or []):
-                prune.add(str(nm).lower())
-            for nm in (self.extra_excludes or []):
-                prune.add(str(nm).lower())
+            prune = set(_BASE_PRUNE_NO_LANG if include_lang else _BASE_PRUNE)
+            prune.update(str(nm).lower() for nm in (cfg.get("exclude") or ()))
+            prune.update(str(nm).lower() for nm in (self.extra_excludes or ()))
+            prune = frozenset(prune)
 
             # Base rim_meta skeleton (builder fills members as it sees defs)  # filecite: turn0file0 
+            # Keep "version" the first key: /api/data/manifest reads it from the file head.
             meta = {"version": version, "defTypes": {}, "enums": {}, "types": {}}
 
             layer_roots = {"official": official, "workshop": workshop, "dev": dev}
@@ -174,48 +371,117 @@ class _Job:
             total_steps = len(selected) + 1
             step = 0
 
+            # Builder output goes through a line-buffered pipe; a reader thread moves it into the log.
+            rfd, wfd = os.pipe()
+            rf = os.fdopen(rfd, "r", encoding="utf-8", errors="replace")
+            wf = os.fdopen(wfd, "w", buffering=1, encoding="utf-8")
+            drain = threading.Thread(target=self._drain, args=(rf,), name=f"rebuild-log-{self.id}", daemon=True)
+            drain.start()
+
             old_out = sys.stdout
-            sys.stdout = w
+            sys.stdout = wf
             try:
-                for L in selected:
-                    roots = layer_roots[L]
-                    if not roots:
-                        (out_dir / f"items.{L}.json").write_text("[]", encoding="utf-8")
-                        print(f"[{L}] no roots provided; wrote empty list.")
-                    else:
-                        print(f"=== Building layer: {L} ===")
-                        print("    Roots:", ", ".join(p.as_posix() for p in roots))
-                        if detected_version and L == "official":
-                            print(f"    Detected Version.txt: {detected_version}")
-
+                to_build = [L for L in selected if layer_roots[L]]
+                mods = {L: rb.discover_layer_mods(layer_roots[L], prune) for L in to_build}
+
+                # Artifact writes (encode + write) run on a side thread so collecting the
+                # remaining mods isn't blocked on the kernel write path; joined before "done".
+                # Workers are spawned, not forked: this process runs server, drain and writer
+                # threads, and forking with threads alive can deadlock the child.
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"rebuild-io-{self.id}") as writer, \
+                        ProcessPoolExecutor(max_workers=rb.worker_count(),
+                                            mp_context=multiprocessing.get_context("spawn")) as ex:
+                    writes = []
+                    outs = []
+                    failed: List[BaseException] = []
+
+                    def io_step(fn, *args):
+                        # Runs on the writer thread. Once a step has failed the rest of the queue
+                        # is skipped, so a failed run never replaces the previous artifacts.
+                        if failed:
+                            return None
+                        try:
+                            return fn(*args)
+                        except BaseException as e:
+                            failed.append(e)
+                            raise
+
+                    def queue_io(fn, *args):
+                        if failed:
+                            raise failed[0]  # stop collecting; the except below cleans up
+                        fut = writer.submit(io_step, fn, *args)
+                        writes.append(fut)
+                        return fut
+
+                    try:
+                        # Every XML file of every selected layer goes on one process pool up front
+                        # (XML parsing holds the GIL), so one big mod never leaves workers idle.
+                        # Results are collected in discovery order, like a sequential build.
                         # Delegates all the heavy lifting to the builder  # filecite: turn0file0 
-                        rb.build_layer(
-                            L,
-                            roots,
-                            out_dir,
-                            meta,
-                            prune_dirs_lower=prune,
-                            verbose=True,
-                            deprec_include_patches=False,
-                        )
-                    step += 1
-                    self.progress = min(0.95, step / total_steps)
-
-                # rim_meta.json (collected during the loop)  # filecite: turn0file0 
-                meta_path = out_dir / "rim_meta.json"
-                meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+                        pending = {L: [rb.submit_mod(L, mod_dir, prune, ex) for mod_dir in mods[L]]
+                                   for L in to_build}
+                        for L in selected:
+                            if L not in mods:
+                                (out_dir / f"items.{L}.json").write_text("[]", encoding="utf-8")
+                                print(f"[{L}] no roots provided; wrote empty list.")
+                                step += 1
+                                self.progress = min(0.95, step / total_steps)
+                                continue
+                            # Headers are printed as each layer is collected, so its log lines follow.
+                            print(f"=== Building layer: {L} ===")
+                            print("    Roots:", ", ".join(p.as_posix() for p in layer_roots[L]))
+                            if detected_version and L == "official":
+                                print(f"    Detected Version.txt: {detected_version}")
+                            # Each file's items are streamed to items.<L>.json on the writer thread
+                            # (single worker, so batches land in order) rather than held per layer.
+                            out = rb.LayerItemsWriter(out_dir, L)
+                            outs.append(out)
+                            emit = lambda chunk, out=out: queue_io(out.write, chunk)
+                            errors: List[Tuple[str, str]] = []
+                            for p in pending.pop(L):
+                                rb.collect_mod(p, meta, prune, emit, errors)
+                                step += 1 / len(mods[L])
+                                self.progress = min(0.95, step / total_steps)
+                            rb.print_errors(L, errors)
+                            if not mods[L]:
+                                step += 1
+                                self.progress = min(0.95, step / total_steps)
+                            # Layer complete: finish the file on the writer, after its batches.
+                            # Wait for it (the pool keeps parsing meanwhile) so "→ wrote" is
+                            # logged before the next layer's header, as in a sequential build.
+                            queue_io(out.close).result()
+                            queue_io(precompress, out.path)
+
+                        # rim_meta.json (collected during the loop)  # filecite: turn0file0 
+                        meta_path = out_dir / "rim_meta.json"
+                        queue_io(_replace_bytes, meta_path, _json_bytes(meta))
+                        queue_io(precompress, meta_path)
+                        for w in writes:
+                            w.result()  # re-raise any write error
+                    except BaseException:
+                        # Don't wait for files still queued on the pool, and drop any half-written
+                        # items.<L>.json.tmp once its queued batches are done (no-op after close).
+                        ex.shutdown(wait=False, cancel_futures=True)
+                        for out in outs:
+                            writer.submit(out.abort)
+                        raise
                 print(f"→ wrote {meta_path} (defTypes: {len(meta['defTypes'])})")
 
                 self.progress = 1.0
-                self.state = "done"
                 print("✔ Done.")
             finally:
                 sys.stdout = old_out
+                wf.close()
+                drain.join()
+            # Only report done once the whole log has been drained.
+            self.state = "done"
+            self._touch()
 
         except Exception as e:
-            self.state = "error"
             self._err = str(e)
             self.log_write(f"\n[error] {e}\n")
+            self.state = "error"
+            self._touch()
 
 
 _current_job: Optional[_Job] = None
@@ -245,6 +511,37 @@ app = Flask(
     static_folder=str(UI_ROOT),  # serve /index.html, /css, /js, /assets straight from repo root
     static_url_path="",
 )
+# Static UI files and artifacts are revalidated on every load (ETag/Last-Modified).
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
+# Behind a proxy that honours X-Sendfile (nginx/Apache), let it stream files instead of Python.
+# Off by default: without such a proxy the client would get an empty body.
+app.config["USE_X_SENDFILE"] = os.environ.get("RIMDEFS_X_SENDFILE", "") == "1"
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; keeps Flask's sort_keys and default() hooks."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+
+def _not_modified(etag: str) -> Optional[Response]:
+    """A bodyless 304 if the client already holds `etag`, else None."""
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag)
+        return resp
+    return None
 
 
 @app.get("/")
@@ -258,9 +555,56 @@ def index():
 # Serve /data/* (generated artifacts from the configured output folder)
 @app.get("/data/<path:filename>")
 def data_file(filename: str):
-    cfg = load_config()
-    out_dir = resolve_out_dir(cfg)
-    return send_from_directory(out_dir, filename)
+    full = safe_join(os.fspath(current_out_dir()), filename)
+    if full is None:
+        abort(404)
+    try:
+        st = os.stat(full)
+    except OSError:
+        abort(404)
+    if not stat.S_ISREG(st.st_mode):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(full)[0] or "application/octet-stream"
+
+    # Prefer a precompressed sibling the client accepts; no compression work per request.
+    send_path, send_st, encoding = full, st, None
+    for enc, suffix in _PRECOMPRESSED:
+        if not request.accept_encodings[enc]:
+            continue
+        try:
+            cst = os.stat(full + suffix)
+        except OSError:
+            continue
+        if cst.st_mtime_ns >= st.st_mtime_ns:
+            send_path, send_st, encoding = full + suffix, cst, enc
+            break
+
+    # Artifacts only change when a build rewrites them, so mtime+size is a sound ETag.
+    etag = f"{send_st.st_mtime_ns:x}-{send_st.st_size:x}" + (f"-{encoding}" if encoding else "")
+    cached = _not_modified(etag)
+    if cached is not None:
+        cached.vary.add("Accept-Encoding")
+        return cached
+
+    if app.config["USE_X_SENDFILE"]:
+        resp = Response(mimetype=mimetype)
+        resp.headers["X-Sendfile"] = send_path
+    else:
+        # wrap_file() hands the file to the server's wsgi.file_wrapper (sendfile where supported).
+        resp = Response(
+            wrap_file(request.environ, open(send_path, "rb"), buffer_size=1 << 20),
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+    if encoding:
+        resp.content_encoding = encoding
+    resp.vary.add("Accept-Encoding")
+    resp.content_length = send_st.st_size
+    resp.last_modified = st.st_mtime
+    resp.set_etag(etag)
+    resp.cache_control.no_cache = True
+    return resp
 
 
 # ---------- API routes ----------
@@ -272,8 +616,7 @@ def api_ping():
 
 @app.get("/api/health")
 def api_health():
-    cfg = load_config()
-    out_dir = resolve_out_dir(cfg)
+    out_dir = current_out_dir()
     has_index = (UI_ROOT / "index.html").exists()
     return jsonify({
         "uiRoot": UI_ROOT.as_posix(),
@@ -283,26 +626,51 @@ def api_health():
     })
 
 
+# Swapped as one tuple, so concurrent requests never see a half-updated entry.
+_API_CONFIG_CACHE: Dict = {"entry": None}
+
+
 @app.get("/api/config")
 def api_get_config():
-    cfg = load_config()
-    # Preserve optional devPaths (labels for UI), but always expose plain dev array too.
-    dev_paths = cfg.get("devPaths") or [{"path": p} for p in cfg.get("dev", [])]
-
-    base_for_rel = CONFIG_PATH.parent
-    official = rb._norm_path_list(cfg.get("official", []), base_for_rel)  # normalize for detection  # filecite: turn0file0 
-    detected = rb.detect_rimworld_version(official) or ""
+    # The body is a pure function of the config file and the detected version, so the last
+    # one is kept serialized: (config key, official roots, detected version, body, etag).
+    cfg_key = _config_key()
+    entry = _API_CONFIG_CACHE["entry"]
+    if entry is not None and entry[0] == cfg_key:
+        cfg, official = None, entry[1]
+    else:
+        cfg = load_config()
+        official = norm_roots(cfg.get("official", []))  # normalize for detection  # filecite: turn0file0 
+    detected = detect_version(official)
 
-    return jsonify({
-        "official": cfg.get("official", []),
-        "workshop": cfg.get("workshop", []),
-        "devPaths": dev_paths,
-        "out": cfg.get("out", "../data"),
-        "include_languages": bool(cfg.get("include_languages", False)),
-        "exclude": cfg.get("exclude", []),
-        "version": cfg.get("version", "unknown"),
-        "detectedVersion": detected,
-    })
+    if entry is None or entry[0] != cfg_key or entry[2] != detected:
+        if cfg is None:
+            cfg = load_config()
+        # Preserve optional devPaths (labels for UI), but always expose plain dev array too.
+        dev_paths = cfg.get("devPaths") or [{"path": p} for p in cfg.get("dev", [])]
+        body = app.json.response({
+            "official": cfg.get("official", []),
+            "workshop": cfg.get("workshop", []),
+            "devPaths": dev_paths,
+            "out": cfg.get("out", "../data"),
+            "include_languages": bool(cfg.get("include_languages", False)),
+            "exclude": cfg.get("exclude", []),
+            "version": cfg.get("version", "unknown"),
+            "detectedVersion": detected,
+        }).get_data()
+        etag = hashlib.blake2b(repr((cfg_key, detected)).encode("utf-8"), digest_size=8).hexdigest()
+        entry = (cfg_key, official, detected, body, etag)
+        if cfg_key is not None:  # a config written just now by load_config() gets keyed next time
+            _API_CONFIG_CACHE["entry"] = entry
+
+    etag = entry[4]
+    cached = _not_modified(etag)
+    if cached is not None:
+        return cached
+    resp = Response(entry[3], mimetype="application/json")
+    resp.set_etag(etag)
+    resp.cache_control.no_cache = True
+    return resp
 
 
 @app.put("/api/config")
@@ -371,24 +739,93 @@ def api_status():
     })
 
 
+@app.get("/api/status/stream")
+def api_status_stream():
+    """
+    Server-Sent Events version of /api/status: one event per change with the log
+    delta since the previous event, a keepalive comment each idle second, and the
+    stream ends once the job is done or failed.
+    """
+    job = get_job(request.args.get("jobId") or "")
+
+    def event(payload: Dict) -> str:
+        return f"data: {app.json.dumps(payload)}\n\n"
+
+    def stream():
+        if not job:
+            yield event({"state": "idle", "progress": 0, "delta": ""})
+            return
+        cursor = 0
+        seen = -1
+        while True:
+            changes = job.wait_change(seen, timeout=1.0)
+            if changes == seen:
+                yield ": keepalive\n\n"
+                continue
+            seen = changes
+            # State before log: by the time the job reports done/error its last lines are in.
+            state = job.state
+            delta, cursor = job.log_since(cursor)
+            yield event({"state": state, "progress": round(float(job.progress), 4), "delta": delta})
+            if state in ("done", "error"):
+                return
+
+    return Response(stream(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+_MANIFEST_NAMES = ("items.official.json", "items.workshop.json", "items.dev.json", "rim_meta.json")
+
+# rim_meta.json is written with "version" as its first key.
+_META_VERSION_RE = re.compile(rb'\A\s*\{\s*"version"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def _meta_version(meta: Path) -> str:
+    """Top-level "version" of rim_meta.json from its first 4 KiB; full parse only if the layout differs."""
+    with meta.open("rb") as f:
+        head = f.read(4096)
+    m = _META_VERSION_RE.match(head)
+    if m:
+        return json.loads(m.group(1))
+    return json.loads(meta.read_bytes()).get("version", "")
+
+
 @app.get("/api/data/manifest")
 def api_manifest():
-    cfg = load_config()
-    out_dir = resolve_out_dir(cfg)
-    files = []
-    for name in ["items.official.json", "items.workshop.json", "items.dev.json", "rim_meta.json"]:
-        p = out_dir / name
-        if p.exists():
-            st = p.stat()
-            files.append({"name": name, "size": st.st_size, "mtime": int(st.st_mtime)})
+    out_dir = current_out_dir()
+    # One directory pass; DirEntry caches its stat (free on Windows) instead of exists() + stat().
+    found = {}
+    try:
+        with os.scandir(out_dir) as it:
+            for entry in it:
+                if entry.name in _MANIFEST_NAMES and entry.is_file():
+                    found[entry.name] = entry.stat()
+    except OSError:
+        pass
+    stats = [(name, found[name]) for name in _MANIFEST_NAMES if name in found]
+
+    # Same folder + same (name, mtime, size) set → same body; skip the meta read entirely.
+    h = hashlib.blake2b(os.fsencode(out_dir), digest_size=8)
+    for name, st in stats:
+        h.update(name.encode("utf-8"))
+        h.update(struct.pack("<qq", st.st_mtime_ns, st.st_size))
+    etag = h.hexdigest()
+    cached = _not_modified(etag)
+    if cached is not None:
+        return cached
+
+    files = [{"name": name, "size": st.st_size, "mtime": int(st.st_mtime)} for name, st in stats]
     version = ""
     meta = out_dir / "rim_meta.json"
-    if meta.exists():
+    if "rim_meta.json" in found:
         try:
-            version = json.loads(meta.read_text(encoding="utf-8")).get("version", "")
+            version = _meta_version(meta)
         except Exception:
             pass
-    return jsonify({"files": files, "version": version})
+    resp = jsonify({"files": files, "version": version})
+    resp.set_etag(etag)
+    resp.cache_control.no_cache = True
+    return resp
 
 
 # ---------- Entrypoint ----------
@@ -409,4 +846,8 @@ if __name__ == "__main__":
     print(f"[helper] Explorer  : http://127.0.0.1:{port}/")
 
     # One process, one origin—no CORS trouble.
-    app.run(host="127.0.0.1", port=port, debug=False, threaded=True)
+    if waitress_serve is not None:
+        print("[helper] Server    : waitress")
+        waitress_serve(app, host="127.0.0.1", port=port, threads=8)
+    else:
+        app.run(host="127.0.0.1", port=port, debug=False, threaded=True)
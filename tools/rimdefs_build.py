@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-RimDefs XML → JSON builder (stdlib only) with deep scanning, config, and version autodetect.
+RimDefs XML → JSON builder (stdlib only; streams with lxml when it is installed) with deep
+scanning, config, and version autodetect.
 
 New:
 - Auto-detect RimWorld version from Version.txt by walking upward from each --official path.
@@ -13,19 +14,40 @@ Scanning:
 - Deeply scans entire mod trees (not just Defs). By default prunes heavy/non-def dirs:
   Languages, Textures, AssetBundles, Assemblies, Sounds, Meshes, Shaders, VCS/build dirs.
 - You can --include-languages to include Languages/**.xml.
+- XML files are parsed on --jobs worker processes (default: CPU count).
 - Emits ONLY "def-like" XML elements (tag endswith Def/DefBase/RulePackDef) to items.*.json.
+- --no-pretty stores each def's XML without indentation instead of re-indenting it;
+  --no-tagmap leaves tagMap empty (the explorer's tag search/similarity then has nothing
+  to match on).
 
 Outputs (default):
   data/items.official.json, data/items.workshop.json, data/items.dev.json, data/rim_meta.json
 """
 from __future__ import annotations
 import argparse
+import contextlib
+import io
 import json
 import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from sys import intern
+from functools import lru_cache
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import AbstractSet, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:  # optional: streaming C parser for Defs files (pip install "lxml>=5"); ElementTree otherwise
+    from lxml import etree as LET
+    if LET.LXML_VERSION < (5,):  # needs resolve_entities="internal" (see _iter_def_elements_lxml)
+        LET = None
+except ImportError:
+    LET = None
+
+try:  # optional: faster JSON encoding of the artifacts (pip install orjson); stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
 
 ET.register_namespace("", "")  # avoid ns clutter
 
@@ -67,10 +89,10 @@ BUILTIN_DEFAULTS = {
 }
 
 # Directories pruned by default during scanning (case-insensitive match on path parts)
-DEFAULT_PRUNE_DIRS = {
+DEFAULT_PRUNE_DIRS = frozenset({
     "languages", "textures", "assetbundles", "assemblies", "sounds", "meshes", "shaders",
     ".git", ".svn", "__macosx", ".idea", ".vs", "obj", "bin"
-}
+})
 
 # ---------- Small path helpers ----------
 
@@ -96,6 +118,14 @@ def _to_config_strings(paths: List[Path], base: Path) -> List[str]:
             out.append(p.as_posix())
     return out
 
+def _dumps(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON for the artifacts: compact (items) or 2-space indented (rim_meta.json)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 # ---------- Config IO ----------
 
 def load_config(path: Path) -> Dict:
@@ -113,17 +143,21 @@ def ensure_default_config(path: Path) -> Dict:
 
 # ---------- Containment & dedupe ----------
 
-def is_within(child: Path, ancestor: Path) -> bool:
-    try:
-        child.resolve().relative_to(ancestor.resolve())
-        return True
-    except Exception:
-        return False
+@lru_cache(maxsize=65536)
+def _resolved_str(p: str) -> str:
+    """os.path.realpath(), memoized: mod roots get resolved over and over during a scan."""
+    return os.path.realpath(p)
+
+def is_within(child, ancestor) -> bool:
+    """True if child (str or Path) resolves to ancestor or somewhere below it."""
+    c = os.path.normcase(_resolved_str(str(child)))
+    a = os.path.normcase(_resolved_str(str(ancestor)))
+    return c == a or c.startswith(a.rstrip(os.sep) + os.sep)
 
 def nearest_about_root(start_dir: Path, scan_root: Path) -> Optional[Path]:
     """Walk upward from start_dir until scan_root looking for About/About.xml."""
-    cur = start_dir.resolve()
-    limit = scan_root.resolve()
+    cur = Path(_resolved_str(str(start_dir)))
+    limit = Path(_resolved_str(str(scan_root)))
     while True:
         if (cur / "About" / "About.xml").exists():
             return cur
@@ -133,7 +167,7 @@ def nearest_about_root(start_dir: Path, scan_root: Path) -> Optional[Path]:
 
 def add_mod_root(mod_roots: Set[Path], candidate: Path) -> None:
     """Maintain a minimal set of mod roots (prefer topmost ancestor)."""
-    candidate = candidate.resolve()
+    candidate = Path(_resolved_str(str(candidate)))
     to_remove: Set[Path] = set()
     for r in list(mod_roots):
         if is_within(candidate, r):
@@ -146,26 +180,61 @@ def add_mod_root(mod_roots: Set[Path], candidate: Path) -> None:
 
 # ---------- Mod discovery (deep) ----------
 
-def discover_mod_dirs(scan_root: Path) -> List[Path]:
+_ABOUT_DIR = os.path.normcase("About")
+_DEFS_DIR = os.path.normcase("Defs")
+
+def _scan_mod_markers(scan_root: Path, prune_dirs_lower: AbstractSet[str]) -> Tuple[List[str], List[str]]:
+    """
+    One os.scandir walk of scan_root collecting (dirs that hold About/About.xml, Defs dirs).
+    Like rglob(), symlinked directories are reported but not entered; pruned ones are skipped.
+    """
+    about_roots: List[str] = []
+    defs_dirs: List[str] = []
+    stack = [str(scan_root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    name = os.path.normcase(entry.name)
+                    if name == _ABOUT_DIR:
+                        if os.path.exists(os.path.join(entry.path, "About.xml")):
+                            about_roots.append(d)
+                    elif name == _DEFS_DIR:
+                        defs_dirs.append(entry.path)
+                    if entry.name.lower() not in prune_dirs_lower and not entry.is_symlink():
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return about_roots, defs_dirs
+
+def discover_mod_dirs(scan_root: Path, prune_dirs_lower: AbstractSet[str] = frozenset()) -> List[Path]:
     """
     Deeply scan 'scan_root' for mod roots.
       - Prefer About/About.xml as mod root.
       - Map Defs dirs to nearest About ancestor; if none, use Defs' parent.
+    Directories in prune_dirs_lower (e.g. Textures) are not descended into.
     """
     mod_roots: Set[Path] = set()
     if not scan_root.exists():
         return []
 
+    about_roots, defs_dirs = _scan_mod_markers(scan_root, prune_dirs_lower)
+
     # Explicit About roots
-    for about_xml in scan_root.rglob("About/About.xml"):
-        add_mod_root(mod_roots, about_xml.parent.parent)
+    for about_root in about_roots:
+        add_mod_root(mod_roots, Path(about_root))
 
     # Defs dirs → associate to nearest About ancestor
-    for defs_dir in scan_root.rglob("Defs"):
-        if not defs_dir.is_dir():
-            continue
-        about_ancestor = nearest_about_root(defs_dir.parent, scan_root)
-        add_mod_root(mod_roots, about_ancestor or defs_dir.parent)
+    for defs_dir in defs_dirs:
+        parent = Path(defs_dir).parent
+        about_ancestor = nearest_about_root(parent, scan_root)
+        add_mod_root(mod_roots, about_ancestor or parent)
 
     return sorted(mod_roots, key=lambda p: p.as_posix().lower())
 
@@ -185,16 +254,38 @@ def read_mod_display(mod_dir: Path) -> str:
     return mod_dir.name
 
 def pretty_xml_of_element(elem: ET.Element) -> str:
-    raw = ET.tostring(elem, encoding="utf-8")
-    try:
-        dom = minidom.parseString(raw)
-        pretty = dom.toprettyxml(indent="  ", encoding="utf-8").decode("utf-8")
-        lines = [ln for ln in pretty.splitlines() if ln.strip()]
-        if lines and lines[0].startswith("<?xml"):
-            lines = lines[1:]
-        return "\n".join(lines)
-    except Exception:
-        return raw.decode("utf-8", errors="replace")
+    """
+    Two-space indented XML for one def, without the XML declaration.
+    Re-indents elem in place (whitespace-only text/tails only), which nothing downstream reads.
+    """
+    if LET is not None and isinstance(elem, LET._Element):
+        # Parsed with remove_blank_text, so libxml2's own pretty printer can lay it out.
+        return LET.tostring(elem, encoding="unicode", pretty_print=True, with_tail=False).rstrip("\n")
+    ET.indent(elem, space="  ")
+    elem.tail = None
+    # ElementTree writes empty elements as "<x />"; keep lxml's (and the old minidom) "<x/>".
+    # A literal " />" can't come from text or attributes, where ">" is escaped.
+    return ET.tostring(elem, encoding="unicode").replace(" />", "/>")
+
+def raw_xml_of_element(elem: ET.Element) -> str:
+    """
+    One def serialized without indentation (--no-pretty). lxml already dropped the blank text
+    at parse time; for ElementTree the whitespace between tags of element-only content is
+    dropped here, so both parsers agree on ordinary defs. Mixed content (text beside child
+    tags) is left as parsed, where libxml2's own blank-text rules can differ.
+    """
+    if LET is not None and isinstance(elem, LET._Element):
+        return LET.tostring(elem, encoding="unicode", with_tail=False)
+    for node in elem.iter():
+        if not len(node):
+            continue
+        if (node.text and node.text.strip()) or any(ch.tail and ch.tail.strip() for ch in node):
+            continue  # mixed content
+        node.text = None
+        for ch in node:
+            ch.tail = None
+    elem.tail = None
+    return ET.tostring(elem, encoding="unicode").replace(" />", "/>")
 
 def first_text(el: Optional[ET.Element]) -> Optional[str]:
     if el is None or el.text is None:
@@ -211,7 +302,47 @@ def extract_def_name(elem: ET.Element) -> Optional[str]:
         return nm.strip()
     return None
 
-def collect_tag_map(elem: ET.Element) -> Dict[str, List[str]]:
+_DEF_SUFFIXES = ("Def", "DefBase", "RulePackDef")
+
+@lru_cache(maxsize=4096)
+def _tag_info(tag: str) -> Tuple[str, bool]:
+    """
+    (interned tag without namespace, whether it names a def: ends with Def/DefBase/RulePackDef)
+    — the same few hundred tags repeat.
+    """
+    stripped = tag.split("}", 1)[1] if tag.startswith("{") else tag
+    return intern(stripped), stripped.endswith(_DEF_SUFFIXES)
+
+# Member kinds ranked from least to most structured; a member keeps the highest kind seen.
+_KIND_NAMES = ("Scalar", "List", "Map", "Class")
+_KIND_ORDER = {name: rank for rank, name in enumerate(_KIND_NAMES)}
+
+# What a node's direct (element) children look like, as gathered by collect_def_info().
+_HAS_CHILD, _HAS_KEY, _HAS_VALUE, _HAS_NON_LI, _HAS_KV_CHILD = 1, 2, 4, 8, 16
+
+def _kind_from_flags(flags: int) -> str:
+    """The member kind for a combination of child flags; see _KIND_BY_FLAGS."""
+    if not flags & _HAS_CHILD:
+        return "Scalar"
+    if not flags & _HAS_NON_LI:
+        return "Map" if flags & _HAS_KV_CHILD else "List"
+    if flags & _HAS_KEY and flags & _HAS_VALUE:
+        return "Map"
+    if flags & _HAS_KV_CHILD:
+        return "Map"
+    return "Class"
+
+# Only 32 flag combinations exist, so every member shape's kind is a table lookup.
+_KIND_BY_FLAGS = tuple(_kind_from_flags(f) for f in range(32))
+
+def collect_def_info(elem: ET.Element,
+                     with_tags: bool = True) -> Tuple[Dict[str, List[str]], List[Tuple[str, str]]]:
+    """
+    The def's tag map ({tag or attribute: sorted distinct values}) and the (member name, kind)
+    of each direct child, from a single walk: each node reports the shape of its children on
+    the way up. Feed the pairs to add_member_ranks(). with_tags=False skips the tag map
+    (returned empty).
+    """
     seen: Dict[str, Set[str]] = {}
 
     def add(tag: str, value: Optional[str]):
@@ -220,99 +351,182 @@ def collect_tag_map(elem: ET.Element) -> Dict[str, List[str]]:
         s = value.strip()
         if not s:
             return
+        # Tag names and short values repeat across every def: share one object each, which
+        # also lets pickle memoize them on the way back from a worker.
+        tag = intern(tag)
         if tag not in seen:
             seen[tag] = set()
-        seen[tag].add(s if len(s) <= 200 else (s[:197] + "…"))
-
-    def walk(node: ET.Element):
-        for k, v in node.attrib.items():
+        if len(s) <= 64:
+            s = intern(s)
+        elif len(s) > 200:
+            s = s[:197] + "…"
+        seen[tag].add(s)
+
+    def walk(node: ET.Element) -> int:
+        if with_tags:
+            for k, v in node.attrib.items():
+                add(k, v)
+            add(node.tag, (node.text or "").strip() or None)
+        flags = 0
+        for ch in node:
+            tag = ch.tag
+            if not isinstance(tag, str):
+                continue
+            ch_flags = walk(ch)
+            flags |= _HAS_CHILD
+            if tag == "key":
+                flags |= _HAS_KEY
+            elif tag == "value":
+                flags |= _HAS_VALUE
+            if tag != "li":
+                flags |= _HAS_NON_LI
+            if ch_flags & _HAS_KEY and ch_flags & _HAS_VALUE:
+                flags |= _HAS_KV_CHILD
+        return flags
+
+    if with_tags:
+        for k, v in elem.attrib.items():
             add(k, v)
-        add(node.tag, (node.text or "").strip() or None)
-        for ch in list(node):
-            if isinstance(ch.tag, str):
-                walk(ch)
-
-    walk(elem)
-    return {k: sorted(list(vals)) for k, vals in seen.items()}
-
-def _strip_ns(tag: str) -> str:
-    """Trim XML namespace from a tag like '{ns}ThingDef' → 'ThingDef'."""
-    if isinstance(tag, str) and tag.startswith("{"):
-        return tag.split("}", 1)[1]
-    return tag
-
-def looks_like_def_tag(tag: str) -> bool:
-    t = _strip_ns(tag) or ""
-    return t.endswith("Def") or t.endswith("DefBase") or t.endswith("RulePackDef")
-
-def infer_member_kind(member_elem: ET.Element) -> str:
-    children = [ch for ch in list(member_elem) if isinstance(ch.tag, str)]
-    if not children:
-        return "Scalar"
-    if all(ch.tag == "li" for ch in children):
-        if any((c.find("key") is not None and c.find("value") is not None) for c in children):
-            return "Map"
-        return "List"
-    if member_elem.find("key") is not None and member_elem.find("value") is not None:
-        return "Map"
-    for ch in children:
-        if ch.find("key") is not None and ch.find("value") is not None:
-            return "Map"
-    return "Class"
+        add(elem.tag, (elem.text or "").strip() or None)
+    member_kinds: List[Tuple[str, str]] = []
+    for ch in elem:
+        if isinstance(ch.tag, str):
+            member_kinds.append((_tag_info(ch.tag)[0], _KIND_BY_FLAGS[walk(ch)]))
 
-def accumulate_meta(meta: Dict, def_type: str, elem: ET.Element) -> None:
+    return {k: sorted(list(vals)) for k, vals in seen.items()}, member_kinds
+
+def add_member_ranks(ranks: Dict[str, Dict[str, int]],
+                     def_type: str,
+                     member_kinds: List[Tuple[str, str]]) -> None:
     """
-    Update meta.defTypes[def_type].members with observed members and inferred kinds.
+    Record (member name, kind) pairs for def_type in a worker's local {def_type: {member:
+    kind rank}} map (ranks index _KIND_NAMES), keeping the highest kind seen;
+    merge_member_ranks() folds it into meta.defTypes afterwards.
     """
-    dt = meta["defTypes"].setdefault(def_type, {"fqcn": def_type, "members": {}})
-    members = dt["members"]
-    for ch in list(elem):
-        if not isinstance(ch.tag, str):
-            continue
-        name = _strip_ns(ch.tag)
-        kind = infer_member_kind(ch)
-        prior = members.get(name)
-        if prior:
-            order = {"Scalar": 0, "List": 1, "Map": 2, "Class": 3}
-            if order.get(kind, 0) > order.get(prior["kind"], 0):
-                members[name] = {"kind": kind, "type": "unknown"}
-        else:
-            members[name] = {"kind": kind, "type": "unknown"}
-
-def iter_def_elements(file_path: Path) -> Iterable[ET.Element]:
+    members = ranks.get(def_type)
+    if members is None:
+        members = ranks[def_type] = {}
+    for name, kind in member_kinds:
+        r = _KIND_ORDER[kind]
+        if r > members.get(name, -1):
+            members[name] = r
+
+def merge_member_ranks(def_types: Dict, ranks: Dict[str, Dict[str, int]]) -> None:
+    """Merge an add_member_ranks() map into a meta.defTypes mapping in one pass."""
+    for def_type, src in ranks.items():
+        dst = def_types.get(def_type)
+        if dst is None:
+            dst = def_types[def_type] = {"fqcn": def_type, "members": {}}
+        members = dst["members"]
+        for name, r in src.items():
+            prior = members.get(name)
+            if prior is None or r > _KIND_ORDER.get(prior["kind"], 0):
+                members[name] = {"kind": _KIND_NAMES[r], "type": "unknown"}
+
+def iter_def_elements(file_path: str) -> Iterable[ET.Element]:
     """
     Parse XML file and yield *only* elements that look like Defs.
     - If root is <Defs>, yield each child that looks like a Def.
     - If single-root, yield it only if it looks like a Def.
+    With lxml each def is yielded as soon as it closes and dropped once the caller moves on,
+    so only one def subtree is alive at a time. A malformed file can then raise after some
+    defs were yielded; callers should treat a file's defs as all-or-nothing.
     """
+    if LET is not None:
+        yield from _iter_def_elements_lxml(file_path)
+        return
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        root = ET.fromstring(_read_bytes(file_path))
     except Exception as e:
         raise RuntimeError(f"Parse error: {e}")
 
-    root_tag = _strip_ns(root.tag)
+    root_tag, root_is_def = _tag_info(root.tag)
     if root_tag == "Defs":
-        for ch in list(root):
-            if isinstance(ch.tag, str) and looks_like_def_tag(ch.tag):
+        for ch in root:
+            if isinstance(ch.tag, str) and _tag_info(ch.tag)[1]:
                 yield ch
     else:
-        if looks_like_def_tag(root.tag):
+        if root_is_def:
             yield root
 
+def _read_bytes(path: str) -> bytes:
+    """A whole file via one open/fstat/read on a raw fd; Defs files are small and read once."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:  # short reads only happen for very large files
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+def _iter_def_elements_lxml(file_path: str) -> Iterable[ET.Element]:
+    # Comments/PIs are dropped and only internal DTD entities are expanded, matching what
+    # ElementTree (expat) sees; external entities are never fetched.
+    # Source indentation is dropped at parse time; pretty_xml_of_element() re-indents.
+    try:
+        context = LET.iterparse(io.BytesIO(_read_bytes(file_path)), events=("end",), huge_tree=True,
+                                remove_blank_text=True, remove_comments=True, remove_pis=True,
+                                resolve_entities="internal")
+    except OSError as e:
+        raise RuntimeError(f"Parse error: {e}")
+    try:
+        for _, elem in context:
+            parent = elem.getparent()
+            if parent is None:
+                # The root closes last: a lone def file rather than a <Defs> wrapper.
+                tag, is_def = _tag_info(elem.tag)
+                if tag != "Defs" and is_def:
+                    yield elem
+            elif parent.getparent() is None and _tag_info(parent.tag)[0] == "Defs":
+                if _tag_info(elem.tag)[1]:
+                    yield elem
+                # Free this def and everything before it under <Defs>.
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+    except LET.XMLSyntaxError as e:
+        raise RuntimeError(f"Parse error: {e}")
+
 # ---------- XML file enumeration (pruned deep walk) ----------
 
-def iter_xml_files_pruned(base_dir: Path, prune_dirs_lower: Set[str]) -> Iterable[Path]:
+_XML_SUFFIXES = (".xml", ".XML")
+
+def iter_xml_files_pruned(base_dir: Path, prune_dirs_lower: AbstractSet[str]) -> Iterable[str]:
     """
-    Yield XML files under base_dir while pruning directories whose *name*
-    matches any entry in prune_dirs_lower (case-insensitive).
+    Yield XML file paths (as str) under base_dir while pruning directories whose *name*
+    matches any entry in prune_dirs_lower (case-insensitive). About/About.xml is skipped
+    (no defs). Same order and symlink handling as os.walk(): files of a directory first,
+    then its subdirectories depth-first; symlinked directories are not entered.
     """
-    base_dir = base_dir.resolve()
-    for root, dirnames, filenames in os.walk(base_dir):
-        dirnames[:] = [d for d in dirnames if d.lower() not in prune_dirs_lower]
-        for fn in filenames:
-            if fn.lower().endswith(".xml"):
-                yield Path(root) / fn
+    stack = [str(base_dir.resolve())]
+    while stack:
+        d = stack.pop()
+        in_about = os.path.basename(d).lower() == "about"
+        subdirs: List[str] = []
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()  # from the dirent type; no stat unless a symlink
+                    except OSError:
+                        is_dir = False
+                    name = entry.name
+                    if is_dir:
+                        if name.lower() not in prune_dirs_lower and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    # Plain ".xml"/".XML" needs no lowercased copy; mixed case still matches.
+                    elif name.endswith(_XML_SUFFIXES) or name[-4:].lower() == ".xml":
+                        if in_about and name.lower() == "about.xml":
+                            continue
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
 # ---------- Version autodetect ----------
 
@@ -341,9 +555,10 @@ def detect_rimworld_version(official_roots: List[Path]) -> Optional[str]:
         if not base:
             continue
         try:
-            txt = (base / "Version.txt").read_text(encoding="utf-8", errors="ignore")
-            # Use the first non-empty line
-            line = next((ln.strip() for ln in txt.splitlines() if ln.strip()), "")
+            # Use the first non-empty line; it's always near the top, so only read the head.
+            with open(base / "Version.txt", encoding="utf-8", errors="ignore") as f:
+                head = f.read(4096)
+            line = head.lstrip().split("\n", 1)[0].strip()
             if line:
                 counts[line] = counts.get(line, 0) + 1
         except Exception:
@@ -355,76 +570,237 @@ def detect_rimworld_version(official_roots: List[Path]) -> Optional[str]:
 
 # ---------- Build layer ----------
 
-def build_layer(layer_name: str,
-                roots: List[Path],
-                out_dir: Path,
-                meta: Dict,
-                prune_dirs_lower: Set[str],
-                verbose: bool = True,
-                deprec_include_patches: bool = False) -> Tuple[int, List[Dict]]:
-    if deprec_include_patches:
-        if verbose:
-            print("ℹ NOTE: --include-patches is now the default and the flag is a no-op.")
-
-    items: List[Dict] = []
-    total_defs = 0
-    seen_mods: Set[Path] = set()
-
+def discover_layer_mods(roots: List[Path], prune_dirs_lower: AbstractSet[str] = frozenset()) -> List[Path]:
+    """All mod roots under a layer's scan roots, in scan order, each real directory once."""
+    # Folders may have moved or been re-symlinked since the last build in this process.
+    _resolved_str.cache_clear()
+    mods: List[Path] = []
+    seen_mods: Set[str] = set()
     for scan_root in roots:
-        mod_dirs = discover_mod_dirs(scan_root)
-        for mod_dir in mod_dirs:
-            real = mod_dir.resolve()
+        for mod_dir in discover_mod_dirs(scan_root, prune_dirs_lower):
+            real = _resolved_str(str(mod_dir))
             if real in seen_mods:
                 continue
             seen_mods.add(real)
+            mods.append(mod_dir)
+    return mods
+
+def _process_xml_file(xf_str: str,
+                      mod_prefix: str,
+                      mod_disp: str,
+                      layer_name: str,
+                      emit_pretty: bool = True,
+                      emit_tagmap: bool = True) -> Tuple[List[Dict], Dict, Optional[str]]:
+    """
+    Emit the def items of one XML file. Module-level and plain-data in/out so it can run in
+    a worker process. Returns (items, member ranks, error), the ranks as add_member_ranks()
+    builds them; on error both are empty, since a file's defs are all-or-nothing (see
+    iter_def_elements).
+    emit_pretty=False stores the def's XML as parsed; emit_tagmap=False leaves tagMap empty.
+    """
+    to_xml = pretty_xml_of_element if emit_pretty else raw_xml_of_element
+    # Same for every def in the file. iter_xml_files_pruned() walks down from the resolved mod
+    # root without entering symlinked dirs, so xf_str starts with mod_prefix (that root plus a
+    # separator, see submit_mod) whenever it is inside the mod: no per-file realpath needed.
+    if xf_str.startswith(mod_prefix):
+        rel_path = xf_str[len(mod_prefix):].replace(os.sep, "/")
+    else:
+        rel_path = os.path.basename(xf_str)
+    abs_path = xf_str.replace(os.sep, "/")
+    mod_disp = intern(mod_disp)
+    layer_name = intern(layer_name)
 
-            mod_disp = read_mod_display(mod_dir)
-
-            # Enumerate *all* XML files under this mod, pruned
-            xml_files = list(iter_xml_files_pruned(mod_dir, prune_dirs_lower))
-            emitted_for_mod = 0
+    items: List[Dict] = []
+    ranks: Dict[str, Dict[str, int]] = {}
+    try:
+        for def_elem in iter_def_elements(xf_str):
+            def_type = _tag_info(def_elem.tag)[0]
+            def_name = extract_def_name(def_elem) or ""
+            xml_str = to_xml(def_elem)
+            tag_map, member_kinds = collect_def_info(def_elem, emit_tagmap)
+
+            add_member_ranks(ranks, def_type, member_kinds)
+
+            item = {
+                "defType": def_type,
+                "defName": def_name,
+                "modDisplay": mod_disp,
+                "layer": layer_name,
+                "path": rel_path,
+                "absPath": abs_path,
+                "xml": xml_str,
+                "tagMap": tag_map,
+            }
+            items.append(item)
+    except Exception as e:
+        return [], {}, str(e)
+    return items, ranks, None
+
+# ProcessPoolExecutor rejects more than 61 workers on Windows (WaitForMultipleObjects limit).
+_MAX_WINDOWS_WORKERS = 61
+
+def worker_count(requested: Optional[int] = None) -> int:
+    """requested (default: CPU count) capped to what ProcessPoolExecutor accepts here."""
+    n = requested or os.cpu_count() or 1
+    if sys.platform == "win32":
+        n = min(n, _MAX_WINDOWS_WORKERS)
+    return max(1, n)
+
+def submit_mod(layer_name: str,
+               mod_dir: Path,
+               prune_dirs_lower: AbstractSet[str],
+               executor: Optional[Executor] = None,
+               emit_pretty: bool = True,
+               emit_tagmap: bool = True) -> Tuple:
+    """
+    Enumerate one mod root's XML files and queue them on executor (in-process and lazily if
+    None). Returns an opaque pending tuple for collect_mod(); submitting every mod before
+    collecting any keeps a pool busy across mod boundaries.
+    """
+    mod_disp = read_mod_display(mod_dir)
+
+    # Enumerate *all* XML files under this mod, pruned (About.xml already left out)
+    work = list(iter_xml_files_pruned(mod_dir, prune_dirs_lower))
+
+    n = len(work)
+    mod_prefix = os.path.join(_resolved_str(str(mod_dir)), "")
+    args = (work, [mod_prefix] * n, [mod_disp] * n, [layer_name] * n,
+            [emit_pretty] * n, [emit_tagmap] * n)
+    if executor is not None:
+        # Executor.map() submits everything up front; chunks amortize the pickling round-trips.
+        results = executor.map(_process_xml_file, *args, chunksize=32)
+    else:
+        results = map(_process_xml_file, *args)
+    return layer_name, mod_disp, n, work, results
 
-            if verbose:
-                print(f"[{layer_name}] {mod_disp}: scanning {len(xml_files)} XML files (pruned dirs: {sorted(prune_dirs_lower)})")
-
-            for xf in xml_files:
-                # Skip About.xml quickly (no defs)
-                if xf.name.lower() == "about.xml" and xf.parent.name.lower() == "about":
-                    continue
-                try:
-                    for def_elem in iter_def_elements(xf):
-                        def_type = _strip_ns(def_elem.tag)
-                        def_name = extract_def_name(def_elem) or ""
-                        xml_str = pretty_xml_of_element(def_elem)
-                        tag_map = collect_tag_map(def_elem)
-
-                        accumulate_meta(meta, def_type, def_elem)
-
-                        item = {
-                            "defType": def_type,
-                            "defName": def_name,
-                            "modDisplay": mod_disp,
-                            "layer": layer_name,
-                            "path": str(xf.relative_to(mod_dir).as_posix()) if is_within(xf, mod_dir) else xf.name,
-                            "absPath": xf.as_posix(),
-                            "xml": xml_str,
-                            "tagMap": tag_map,
-                        }
-                        items.append(item)
-                        emitted_for_mod += 1
-                        total_defs += 1
-                except Exception as e:
-                    print(f"  ! Error in {xf}: {e}")
+def collect_mod(pending: Tuple,
+                meta: Dict,
+                prune_dirs_lower: AbstractSet[str],
+                emit: Callable[[List[Dict]], None],
+                errors: List[Tuple[str, str]],
+                verbose: bool = True) -> int:
+    """
+    Gather a submit_mod() result in file order, merging its members into meta and passing
+    each file's items to emit (e.g. LayerItemsWriter.write). Files that failed are appended
+    to errors as (path, message) for print_errors(). Returns the number of items.
+    """
+    layer_name, mod_disp, n_files, work, results = pending
+    if verbose:
+        print(f"[{layer_name}] {mod_disp}: scanning {n_files} XML files (pruned dirs: {sorted(prune_dirs_lower)})")
 
-            if verbose:
-                print(f"    → emitted {emitted_for_mod} defs from {mod_disp}")
+    count = 0
+    for xf, (file_items, ranks, error) in zip(work, results):
+        if error is not None:
+            errors.append((xf, error))
+            continue
+        if file_items:
+            emit(file_items)
+            count += len(file_items)
+        merge_member_ranks(meta["defTypes"], ranks)
 
-    out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / f"items.{layer_name}.json"
-    out_path.write_text(json.dumps(items, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
     if verbose:
-        print(f"  → wrote {out_path} ({len(items)} items, {total_defs} defs emitted)")
-    return total_defs, items
+        print(f"    → emitted {count} defs from {mod_disp}")
+    return count
+
+# Failed files listed by print_errors(); the rest are only counted.
+MAX_ERRORS_SHOWN = 20
+
+def print_errors(layer_name: str, errors: List[Tuple[str, str]]) -> None:
+    """One summary of the files that failed to parse in a layer (printed even with --quiet)."""
+    if not errors:
+        return
+    print(f"  ! [{layer_name}] {len(errors)} file(s) failed to parse:")
+    for xf, error in errors[:MAX_ERRORS_SHOWN]:
+        print(f"    {xf}: {error}")
+    if len(errors) > MAX_ERRORS_SHOWN:
+        print(f"    … and {len(errors) - MAX_ERRORS_SHOWN} more")
+
+class LayerItemsWriter:
+    """
+    Streams items.<layer>.json one batch of items at a time, so a layer never has to sit in
+    memory whole. Written under a .tmp name and moved into place by close(), so readers
+    never see a half-written array; abort() drops it instead. After a failed write() later
+    batches are ignored and close() aborts and re-raises, so the previous file is kept.
+    """
+
+    def __init__(self, out_dir: Path, layer_name: str):
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.path = out_dir / f"items.{layer_name}.json"
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._f = open(self._tmp, "wb", buffering=1 << 20)
+        self._f.write(b"[")
+        self.count = 0
+        self._error: Optional[BaseException] = None
+
+    def write(self, items: List[Dict]) -> None:
+        if self._error is not None:
+            return
+        f = self._f
+        try:
+            for item in items:
+                if self.count:
+                    f.write(b",")
+                f.write(_dumps(item))
+                self.count += 1
+        except BaseException as e:
+            self._error = e
+            raise
+
+    def close(self, verbose: bool = True) -> Path:
+        if self._error is not None:
+            self.abort()
+            raise self._error
+        try:
+            self._f.write(b"]")
+            self._f.close()
+            os.replace(self._tmp, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        if verbose:
+            print(f"  → wrote {self.path} ({self.count} items, {self.count} defs emitted)")
+        return self.path
+
+    def abort(self) -> None:
+        self._f.close()
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+def build_layer(layer_name: str,
+                roots: List[Path],
+                out_dir: Path,
+                meta: Dict,
+                prune_dirs_lower: AbstractSet[str],
+                verbose: bool = True,
+                deprec_include_patches: bool = False,
+                executor: Optional[Executor] = None,
+                emit_pretty: bool = True,
+                emit_tagmap: bool = True) -> int:
+    """
+    Build one layer, streaming items.<layer>.json; returns the number of defs written.
+    With an executor (see --jobs) XML files are parsed in parallel; output and log order
+    are the same as a sequential build.
+    """
+    if deprec_include_patches:
+        if verbose:
+            print("ℹ NOTE: --include-patches is now the default and the flag is a no-op.")
+
+    pending = [submit_mod(layer_name, mod_dir, prune_dirs_lower, executor,
+                          emit_pretty, emit_tagmap)
+               for mod_dir in discover_layer_mods(roots, prune_dirs_lower)]
+    out = LayerItemsWriter(out_dir, layer_name)
+    errors: List[Tuple[str, str]] = []
+    try:
+        for p in pending:
+            collect_mod(p, meta, prune_dirs_lower, out.write, errors, verbose=verbose)
+    except BaseException:
+        out.abort()
+        raise
+    print_errors(layer_name, errors)
+    out.close(verbose=verbose)
+    return out.count
 
 # ---------- Main ----------
 
@@ -459,6 +835,12 @@ def main():
     ap.add_argument("--no-auto-version", action="store_true",
                     help="Disable Version.txt autodetection (use CLI/config/built-in).")
 
+    ap.add_argument("--jobs", "-j", type=int, default=worker_count(),
+                    help="Worker processes for XML parsing (default: CPU count; 1 = no pool).")
+    ap.add_argument("--no-pretty", action="store_true",
+                    help="Store each def's XML serialized without indentation (faster).")
+    ap.add_argument("--no-tagmap", action="store_true",
+                    help="Emit empty tagMaps (faster; disables tag search/similarity in the UI).")
     ap.add_argument("--quiet", action="store_true", help="Reduce log noise.")
     ap.add_argument("--save-config", action="store_true",
                     help="Persist the effective settings back to the config file.")
@@ -536,8 +918,9 @@ def main():
         prune.remove("languages")
     if args.exclude:
         prune.update(n.lower() for n in args.exclude)
+    prune = frozenset(prune)
 
-    # Base rim_meta skeleton
+    # Base rim_meta skeleton ("version" stays the first key; the helper reads it from the file head)
     meta = {
         "version": version,
         "defTypes": {},
@@ -551,32 +934,38 @@ def main():
         ("workshop", workshop),
         ("dev", dev),
     ]
-    for layer_name, layer_roots in layers:
-        if not layer_roots:
-            (out_dir / f"items.{layer_name}.json").write_text("[]", encoding="utf-8")
+    jobs = worker_count(args.jobs)
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext()
+    with pool as executor:
+        for layer_name, layer_roots in layers:
+            if not layer_roots:
+                (out_dir / f"items.{layer_name}.json").write_text("[]", encoding="utf-8")
+                if verbose:
+                    print(f"[{layer_name}] no roots provided; wrote empty list.")
+                continue
             if verbose:
-                print(f"[{layer_name}] no roots provided; wrote empty list.")
-            continue
-        if verbose:
-            roots_list = ", ".join(r.as_posix() for r in layer_roots)
-            print(f"=== Building layer: {layer_name} ===")
-            print(f"    Roots: {roots_list}")
-            if detected_version and layer_name == "official":
-                print(f"    Detected Version.txt: {detected_version}")
-        total_defs, _ = build_layer(
-            layer_name,
-            layer_roots,
-            out_dir,
-            meta,
-            prune_dirs_lower=prune,
-            verbose=verbose,
-            deprec_include_patches=args.include_patches
-        )
-        grand_total += total_defs
+                roots_list = ", ".join(r.as_posix() for r in layer_roots)
+                print(f"=== Building layer: {layer_name} ===")
+                print(f"    Roots: {roots_list}")
+                if detected_version and layer_name == "official":
+                    print(f"    Detected Version.txt: {detected_version}")
+            total_defs = build_layer(
+                layer_name,
+                layer_roots,
+                out_dir,
+                meta,
+                prune_dirs_lower=prune,
+                verbose=verbose,
+                deprec_include_patches=args.include_patches,
+                executor=executor,
+                emit_pretty=not args.no_pretty,
+                emit_tagmap=not args.no_tagmap
+            )
+            grand_total += total_defs
 
     # Write meta
     meta_path = out_dir / "rim_meta.json"
-    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    meta_path.write_bytes(_dumps(meta, indent=True))
     if verbose:
         print(f"→ wrote {meta_path} (defTypes: {len(meta['defTypes'])}, total defs observed: {grand_total})")
 